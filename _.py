@@ -11,6 +11,13 @@ COULEUR_LIGNES = (0, 204, 204)
 CIRCLE_SIZE = 15
 WIDTH = 5
 
+# Arêtes du graphe : (indice du nœud de départ, indice du nœud d'arrivée, label)
+EDGES = [(0, 1, "1-2"), (1, 2, "2-3"), (2, 0, "3-1")]
+
+def node_positions(width, height):
+    """Positions des nœuds 1, 2 et 3 pour une fenêtre de taille (width, height)."""
+    return [(width // 4, height // 4), (width // 2, 1.5*height // 2), (3 * width // 4, height // 4)]
+
 # def draw_line(surface, color, start_pos, end_pos, name=None, width=1, oriented=False):
     
 #     if oriented:
@@ -36,30 +43,57 @@ WIDTH = 5
 
 
 
-pygame.init()
-FONT = pygame.font.Font(None, 24)
-screen = pygame.display.set_mode((400, 300), pygame.RESIZABLE)
-pygame.display.set_caption('Graphes')
-horloge = pygame.time.Clock()
-FPS = 60
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+def main():
+    pygame.init()
+    FONT = pygame.font.Font(None, 24)
+    screen = pygame.display.set_mode((400, 300), pygame.RESIZABLE)
+    pygame.display.set_caption('Graphes')
+    # Les labels sont statiques : on les rend une seule fois (après set_mode pour convert_alpha)
+    LABEL_SURFS = {name: FONT.render(name, True, (0, 0, 0)).convert_alpha() for name in ("1", "2", "3", "1-2", "2-3", "3-1")}
+    # Les positions ne dépendent que de la taille de la fenêtre : recalculées au redimensionnement
+    positions = node_positions(*screen.get_size())
+    horloge = pygame.time.Clock()
+    FPS = 60
+    # Fonctions appelées à chaque frame, liées en variables locales
+    draw_line = dg.draw_line
+    draw_circle = dg.draw_circle
+    flip = pygame.display.flip
+    event_get = pygame.event.get
+    tick = horloge.tick
+    running = True
+    # La scène ne change qu'au redimensionnement : on ne redessine que si nécessaire
+    dirty = True
+    # Dernière image rendue et la clé de contenu (taille, nœuds, arêtes) qui la décrit :
+    # si la clé n'a pas changé, l'image est simplement recopiée au lieu d'être redessinée
+    frame_cache = None
+    frame_key = None
+    while running:
+        for event in event_get():
+            if event.type == pygame.QUIT:
+                running = False
         
-        if event.type == pygame.VIDEORESIZE:
-            screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-    screen.fill((255, 255, 255))
-    pos1 = (screen.get_width() // 4, screen.get_height() // 4)
-    pos2 = (screen.get_width() // 2, 1.5*screen.get_height() // 2)
-    pos3 = (3 * screen.get_width() // 4, screen.get_height() // 4)
-    dg.draw_circle(screen, FONT, COULEUR_CERCLE_EXTERIEUR, COULEUR_CERCLE_CENTRE, pos1, CIRCLE_SIZE, 1)
-    dg.draw_circle(screen, FONT, COULEUR_CERCLE_EXTERIEUR, COULEUR_CERCLE_CENTRE, pos2, CIRCLE_SIZE, 2)
-    dg.draw_circle(screen, FONT, COULEUR_CERCLE_EXTERIEUR, COULEUR_CERCLE_CENTRE, pos3, CIRCLE_SIZE, 3)
-    dg.draw_line(screen, FONT, COULEUR_LIGNES, pos1, pos2, label="1-2", offset_end=CIRCLE_SIZE, offset_start=CIRCLE_SIZE)
-    dg.draw_line(screen, FONT, COULEUR_LIGNES, pos2, pos3, label="2-3", offset_end=CIRCLE_SIZE, offset_start=CIRCLE_SIZE)
-    dg.draw_line(screen, FONT, COULEUR_LIGNES, pos3, pos1, label="3-1", offset_end=CIRCLE_SIZE, offset_start=CIRCLE_SIZE)
-    pygame.display.flip()
-    horloge.tick(FPS)
-pygame.quit()
\ No newline at end of file
+            if event.type == pygame.VIDEORESIZE:
+                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                positions = node_positions(*screen.get_size())
+                dirty = True
+            if event.type == pygame.WINDOWEXPOSED:
+                dirty = True
+        if dirty:
+            key = (screen.get_size(), tuple(positions), tuple(EDGES))
+            if key == frame_key:
+                screen.blit(frame_cache, (0, 0))
+            else:
+                screen.fill((255, 255, 255))
+                for i, pos in enumerate(positions):
+                    draw_circle(screen, FONT, COULEUR_CERCLE_EXTERIEUR, COULEUR_CERCLE_CENTRE, pos, CIRCLE_SIZE, label_surface=LABEL_SURFS[str(i + 1)])
+                for a, b, name in EDGES:
+                    draw_line(screen, FONT, COULEUR_LIGNES, positions[a], positions[b], label_surface=LABEL_SURFS[name], offset_end=CIRCLE_SIZE, offset_start=CIRCLE_SIZE)
+                frame_cache = screen.copy()
+                frame_key = key
+            flip()
+            dirty = False
+        tick(FPS)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,11 @@ des nœuds circulaires. Il est conçu pour être utilisé dans des visualisation
 ou d'algorithmes sur des graphes (parcours, flot, etc.).
 # Dépendances
 -----------
-- pygame
+- pygame (pygame-ce recommandé : même API, importé sous le nom pygame, mais plus rapide
+  sur les primitives de dessin, les blits et le rendu de texte)
 - math
 - enum (Enum)
+- numpy (optionnel, uniquement pour draw_edges)
 API publique
 ------------
 - ArrowType (Enum)
@@ -22,8 +24,21 @@ API publique
             arrow_type=ArrowType.SINGLE, arrow_size=18,
             offset_start=0, offset_end=0,
             label=None, label_color=(0,0,0),
-            label_offset_x=0, label_offset_y=0)
+            label_offset_x=0, label_offset_y=0, label_surface=None)
     Dessine une "arête" entre deux points avec options pour flèches et texte.
+- compute_edge_geometry(start_pos, end_pos, thickness=6, arrow_type=ArrowType.SINGLE,
+                        arrow_size=18, offset_start=0, offset_end=0)
+    Calcule la tige et les têtes de flèche d'une arête sans rien dessiner.
+- queue_edge(color, start_pos, end_pos, ...) / flush_edges(surface)
+    Met des arêtes en attente puis les dessine en une passe, groupées par style.
+- draw_edges(surface, FONT, color, starts, ends, ..., labels=None, ...)
+    Dessine un lot d'arêtes ; la géométrie est calculée de façon vectorisée (numpy).
+- draw_circle(surface, FONT, color, center_color, position, radius,
+              inner_radius=None, name=None, label_surface=None)
+    Dessine un nœud circulaire (anneau et centre) avec un label centré, rendu depuis name
+    ou fourni déjà rendu via label_surface.
+- clear_label_cache()
+    Vide le cache des surfaces de labels (libéré aussi avec chaque police).
 # draw_line — Paramètres détaillés
 --------------------------------
 - surface : pygame.Surface
@@ -40,7 +55,8 @@ API publique
     Épaisseur en pixels de la tige (ligne). La fonction évite de dessiner si la tige
     calculée devient trop courte (inférieure à thickness).
 - arrow_type : ArrowType, optionnel (défaut ArrowType.SINGLE)
-    Type de flèches à dessiner : NONE, SINGLE ou DOUBLE.
+    Type de flèches à dessiner : NONE, SINGLE ou DOUBLE. Seuls les membres d'ArrowType
+    sont acceptés ; toute autre valeur (par exemple None) ne dessine aucune tête.
 - arrow_size : int, optionnel (défaut 18)
     Taille approximative (longueur) des têtes de flèche en pixels. Les têtes sont
     dessinées comme des triangles centrés sur les points finaux.
@@ -50,6 +66,9 @@ API publique
     les nœuds (par exemple rayon du nœud).
 - label : str | None, optionnel
     Texte à afficher centré sur la tige. Si None, aucun texte n'est rendu.
+- label_surface : pygame.Surface | None, optionnel (défaut None)
+    Label déjà rendu par l'appelant (par exemple une seule fois hors de la boucle
+    principale). S'il est fourni, il est blitté tel quel et label / FONT sont ignorés.
 - label_color : tuple[int, int, int], optionnel (défaut (0, 0, 0))
     Couleur du texte du label (R, G, B).
 - label_offset_x, label_offset_y : int, optionnel (défaut 0)
@@ -62,13 +81,19 @@ API publique
   à arrow_size) pour que la flèche ne chevauche pas la tige.
 - Si la distance entre start_pos et end_pos est nulle (même point), la fonction
   retourne sans rien dessiner.
+- Une arête dont la boîte englobante (élargie de l'épaisseur, de la flèche et du label)
+  est entièrement hors de la zone de clipping de la surface est ignorée d'emblée, sans
+  calcul de géométrie.
 - La fonction vérifie également que la tige résultante ait une longueur suffisante
   (supérieure à thickness) avant le dessin, pour éviter des artefacts visuels.
 - Les têtes de flèche sont dessinées comme des polygones triangulaires simples. Leur
-  orientation est calculée à partir de l'angle de la ligne. Pour une tête au départ,
-  l'angle est inversé (angle + pi).
-- Le label est rendu via FONT.render et centré sur la tige entre line_start et line_end,
-  puis décalé via label_offset_x / label_offset_y et blitté sur la surface.
+  orientation est obtenue en tournant de +/-30° le vecteur unitaire de la ligne. Pour une
+  tête au départ, ce vecteur est inversé.
+- Le label est rendu via FONT.render (ou fourni via label_surface) et centré sur la tige
+  entre line_start et line_end (centre arrondi au pixel le plus proche), puis décalé via
+  label_offset_x / label_offset_y et blitté sur la surface.
+- Les surfaces de labels sont mises en cache par (texte, couleur, police) et réutilisées
+  d'une frame à l'autre ; les surfaces d'une police sont libérées avec elle.
 Exemples d'utilisation
 ----------------------
 - Dessiner une arête orientée simple :
@@ -87,6 +112,12 @@ Exemples d'utilisation
 - Veiller à appeler pygame.init() et pygame.font.init() au préalable dans l'application
   et à mettre à jour l'affichage avec pygame.display.flip() ou pygame.display.update()
   après les opérations de dessin.
+- Créer de préférence la fenêtre (pygame.display.set_mode) avant le premier dessin d'un
+  label : les surfaces mises en cache sont alors converties au format de l'affichage
+  (convert_alpha) pour que les blits suivants n'aient pas à convertir les pixels. Sans
+  fenêtre (dessin sur une surface hors écran), elles sont mises en cache telles quelles.
+  De même, les surfaces passées via label_surface gagnent à être converties avec
+  .convert_alpha() par l'appelant.
 - Adapter offset_start / offset_end aux rayons des nœuds (ou autres formes) pour
   garantir une apparence nette et éviter les chevauchements.
 # Licence et attribution
@@ -95,9 +126,91 @@ Ce module est fourni sans garantie explicite. Peut être modifié pour répondre
 spécifiques d'une application de visualisation de graphes.
 """
 
-import pygame, math
+import pygame, math, weakref
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # numpy n'est requis que par draw_edges
+    np = None
+
+__all__ = ["ArrowType", "compute_edge_geometry", "draw_line", "queue_edge", "flush_edges",
+           "draw_edges", "draw_circle", "clear_label_cache"]
+
+# Cache des surfaces de labels déjà rendues : police -> {(texte, couleur): surface}.
+# Le rendu FreeType d'un texte est l'opération la plus coûteuse de draw_line ;
+# les labels étant en pratique identiques d'une frame à l'autre, on les réutilise.
+# La police est une clé faible : ses surfaces disparaissent avec elle, et une nouvelle
+# police ne peut jamais récupérer celles d'une ancienne.
+_LABEL_CACHE: "weakref.WeakKeyDictionary[pygame.font.Font, dict[tuple, pygame.Surface]]" = weakref.WeakKeyDictionary()
+
+# Demi-angle d'ouverture des têtes de flèche (30°), précalculé pour éviter atan2/cos/sin.
+_COS_30 = math.cos(math.pi / 6)
+_SIN_30 = math.sin(math.pi / 6)
+
+# Arêtes en attente de dessin (voir queue_edge / flush_edges), regroupées par style :
+# tiges indexées par (couleur, épaisseur), têtes de flèche indexées par couleur.
+_pending_lines: dict[tuple, list[tuple[tuple, tuple]]] = {}
+_pending_polys: dict[tuple, list[list[tuple]]] = {}
+
+def clear_label_cache() -> None:
+    """
+    Vide le cache des surfaces de labels utilisé par draw_line.
+
+    Les surfaces d'une police sont libérées avec elle ; cette fonction permet de libérer
+    aussi celles des polices encore utilisées (par exemple après beaucoup de labels
+    différents).
+
+    Returns:
+        None
+    """
+    _LABEL_CACHE.clear()
+
+def _label_key(label, label_color) -> tuple:
+    """Retourne la clé (texte, couleur) d'un label dans le cache d'une police."""
+    try:
+        label = str(label)
+    except Exception:
+        label = "?"
+    if not isinstance(label_color, (tuple, str)):
+        label_color = tuple(label_color)  # list ou pygame.Color : non hachables
+    return label, label_color
+
+def _label_extent(FONT:pygame.font.Font, label, label_color:tuple) -> tuple:
+    """
+    Retourne (surface, étendue) d'un label sans le rastériser.
+
+    Si le label est déjà en cache, sa surface est retournée avec sa plus grande dimension ;
+    sinon surface vaut None et l'étendue est mesurée par FONT.size (métriques seules).
+    Sert à élargir les tests de rejet hors écran avant tout rendu de texte.
+    """
+    key = _label_key(label, label_color)
+    font_cache = _LABEL_CACHE.get(FONT)
+    text_surface = font_cache.get(key) if font_cache is not None else None
+    if text_surface is not None:
+        return text_surface, max(text_surface.get_size())
+    return None, max(FONT.size(key[0]))
+
+def _get_label_surface(FONT:pygame.font.Font, label, label_color:tuple) -> pygame.Surface:
+    """
+    Retourne la surface rendue de label, depuis _LABEL_CACHE si elle y est déjà.
+
+    La surface n'est convertie au format de l'affichage (convert_alpha) que si une fenêtre
+    existe ; sinon le rendu brut est mis en cache, ce qui permet de dessiner sur des
+    surfaces hors écran sans pygame.display.set_mode.
+    """
+    key = _label_key(label, label_color)
+    font_cache = _LABEL_CACHE.get(FONT)
+    if font_cache is None:
+        font_cache = _LABEL_CACHE[FONT] = {}
+    text_surface = font_cache.get(key)
+    if text_surface is None:
+        text_surface = FONT.render(key[0], True, key[1])
+        if pygame.display.get_surface() is not None:
+            text_surface = text_surface.convert_alpha()
+        font_cache[key] = text_surface
+    return text_surface
+
 class ArrowType(Enum):
     """Énumération définissant le placement des têtes de flèche pour les arêtes du graphe.
 
@@ -116,12 +229,145 @@ class ArrowType(Enum):
     SINGLE = 1  # Flèche sur end_pos
     DOUBLE = 2  # Flèche sur start_pos et end_pos
 
+def _arrow_head_points(pos:tuple, ux:float, uy:float, size:float) -> list:
+    """
+    Retourne le triangle [pos, point1, point2] d'une tête de flèche de pointe pos.
+
+    (ux, uy) est la direction unitaire de la pointe ; les deux autres sommets s'obtiennent
+    en reculant de size le long de cette direction tournée de -30° et +30°.
+    """
+    point1 = (
+        pos[0] - size * (ux * _COS_30 + uy * _SIN_30),
+        pos[1] - size * (uy * _COS_30 - ux * _SIN_30)
+    )
+    point2 = (
+        pos[0] - size * (ux * _COS_30 - uy * _SIN_30),
+        pos[1] - size * (uy * _COS_30 + ux * _SIN_30)
+    )
+    return [pos, point1, point2]
+
+def _make_edge_geometry(arrow_type:ArrowType):
+    """
+    Construit la fonction de géométrie d'arête spécialisée pour arrow_type.
+
+    Le type de flèche est résolu une seule fois ici : la fonction retournée ne compare
+    plus d'ArrowType et ne teste que deux booléens capturés.
+    """
+    with_arrow_end = arrow_type is ArrowType.SINGLE or arrow_type is ArrowType.DOUBLE
+    with_arrow_start = arrow_type is ArrowType.DOUBLE
+
+    def edge_geometry(start_pos, end_pos, thickness, arrow_size, offset_start, offset_end):
+        # 1. Calculs des points et application des offsets
+        dx = end_pos[0] - start_pos[0]
+        dy = end_pos[1] - start_pos[1]
+        length = math.hypot(dx, dy)
+
+        if length == 0: 
+            return None
+
+        # Vecteur unitaire (direction de la ligne)
+        unit_vx, unit_vy = dx / length, dy / length
+        
+        # 2. Détermination des points de fin de la TIGE de la ligne
+        
+        # Si une flèche est présente, la tige doit s'arrêter AVANT le final_point.
+        # On ajoute donc arrow_size*0.8 à l'offset (pour éviter que la ligne soit trop courte).
+        
+        offset_line_end = offset_end
+        if with_arrow_end:
+            offset_line_end += arrow_size*0.8
+            
+        offset_line_start = offset_start
+        if with_arrow_start:
+            offset_line_start += arrow_size*0.8
+
+        # Points d'extrémité de la tige
+        line_start = (
+            start_pos[0] + unit_vx * offset_line_start,
+            start_pos[1] + unit_vy * offset_line_start
+        )
+        line_end = (
+            end_pos[0] - unit_vx * offset_line_end,
+            end_pos[1] - unit_vy * offset_line_end
+        )
+        
+        # Vérification de la longueur après décalage
+        new_length = math.hypot(line_end[0] - line_start[0], line_end[1] - line_start[1])
+        if new_length < thickness: 
+            return None
+
+        # 3. Têtes de flèche
+        # La POINTE de la flèche se trouve à offset_end de end_pos (resp. offset_start de start_pos)
+        arrow_heads = []
+        if with_arrow_end:
+            # Tête sur le point d'arrivée (final_point_end)
+            final_point_end = (
+                end_pos[0] - unit_vx * offset_end,
+                end_pos[1] - unit_vy * offset_end
+            )
+            arrow_heads.append(_arrow_head_points(final_point_end, unit_vx, unit_vy, arrow_size))
+
+        if with_arrow_start:
+            # Tête sur le point de départ (final_point_start), direction inversée
+            final_point_start = (
+                start_pos[0] + unit_vx * offset_start,
+                start_pos[1] + unit_vy * offset_start
+            )
+            arrow_heads.append(_arrow_head_points(final_point_start, -unit_vx, -unit_vy, arrow_size))
+
+        return line_start, line_end, arrow_heads
+
+    return edge_geometry
+
+# Géométrie spécialisée par type de flèche. La sélection se fait par identité contre des
+# alias globaux des membres (voir draw_line) : ni Enum.__hash__ ni accès aux attributs de
+# la classe Enum sur le chemin critique. Toute valeur qui n'est pas un membre d'ArrowType
+# retombe sur la géométrie sans flèche.
+_ARROW_SINGLE = ArrowType.SINGLE
+_ARROW_DOUBLE = ArrowType.DOUBLE
+_GEOM_NONE = _make_edge_geometry(ArrowType.NONE)
+_GEOM_SINGLE = _make_edge_geometry(ArrowType.SINGLE)
+_GEOM_DOUBLE = _make_edge_geometry(ArrowType.DOUBLE)
+
+def compute_edge_geometry(start_pos:tuple, end_pos:tuple, thickness:int=6,
+                          arrow_type:ArrowType=ArrowType.SINGLE, arrow_size:int=18,
+                          offset_start:int=0, offset_end:int=0) -> tuple:
+    """
+    Calcule la géométrie d'une arête sans rien dessiner.
+
+    Args:
+        start_pos (tuple): Coordonnées (x, y) du point de départ.
+        end_pos (tuple): Coordonnées (x, y) du point d'arrivée.
+        thickness (int, optional): Épaisseur de la ligne. Défaut 6.
+        arrow_type (ArrowType, optional): Type de flèche (aucune, simple, double). Défaut ArrowType.SINGLE.
+            Seuls les membres d'ArrowType sont acceptés ; toute autre valeur est traitée comme ArrowType.NONE.
+        arrow_size (int, optional): Taille des têtes de flèche. Défaut 18.
+        offset_start (int, optional): Décalage depuis le point de départ. Défaut 0.
+        offset_end (int, optional): Décalage depuis le point d'arrivée. Défaut 0.
+
+    Returns:
+        tuple | None: (line_start, line_end, arrow_heads) où arrow_heads est la liste des
+        triangles [pointe, point1, point2] à remplir (tête d'arrivée puis tête de départ).
+        None si l'arête est dégénérée ou si la tige est plus courte que thickness.
+    """
+    geometry = (_GEOM_DOUBLE if arrow_type is _ARROW_DOUBLE
+                else _GEOM_SINGLE if arrow_type is _ARROW_SINGLE else _GEOM_NONE)
+    return geometry(start_pos, end_pos, thickness, arrow_size, offset_start, offset_end)
+
+def _is_outside_clip(clip:pygame.Rect, start_pos:tuple, end_pos:tuple, margin:float) -> bool:
+    """Indique si la boîte englobante du segment, élargie de margin, est hors de clip."""
+    sx, sy = start_pos
+    ex, ey = end_pos
+    return (max(sx, ex) + margin < clip.left or min(sx, ex) - margin > clip.right
+            or max(sy, ey) + margin < clip.top or min(sy, ey) - margin > clip.bottom)
+
 def draw_line(surface:pygame.Surface, FONT:pygame.font.Font, color:tuple, 
                     start_pos:tuple, end_pos:tuple, thickness:int=6,
                     arrow_type:ArrowType=ArrowType.SINGLE, arrow_size:int=18,
                     offset_start:int=0, offset_end:int=0,
                     label:str=None, label_color:tuple=(0, 0, 0),
-                    label_offset_x:int=0, label_offset_y:int=0) -> None:
+                    label_offset_x:int=0, label_offset_y:int=0,
+                    label_surface:pygame.Surface=None) -> None:
     """
     Dessine une ligne entre deux points avec éventuellement des flèches et un label.
 
@@ -133,6 +379,7 @@ def draw_line(surface:pygame.Surface, FONT:pygame.font.Font, color:tuple,
         end_pos (tuple): Coordonnées (x, y) du point d'arrivée.
         thickness (int, optional): Épaisseur de la ligne. Défaut 6.
         arrow_type (ArrowType, optional): Type de flèche (aucune, simple, double). Défaut ArrowType.SINGLE.
+            Seuls les membres d'ArrowType sont acceptés ; toute autre valeur est traitée comme ArrowType.NONE.
         arrow_size (int, optional): Taille des têtes de flèche. Défaut 18.
         offset_start (int, optional): Décalage depuis le point de départ. Défaut 0.
         offset_end (int, optional): Décalage depuis le point d'arrivée. Défaut 0.
@@ -140,6 +387,8 @@ def draw_line(surface:pygame.Surface, FONT:pygame.font.Font, color:tuple,
         label_color (tuple, optional): Couleur du texte du label (R, G, B). Défaut (0, 0, 0).
         label_offset_x (int, optional): Décalage horizontal du label. Défaut 0.
         label_offset_y (int, optional): Décalage vertical du label. Défaut 0.
+        label_surface (pygame.Surface, optional): Surface de label déjà rendue par l'appelant.
+            Si fournie, elle est blittée directement et label / FONT sont ignorés. Défaut None.
     
     Returns:
         None
@@ -155,102 +404,222 @@ def draw_line(surface:pygame.Surface, FONT:pygame.font.Font, color:tuple,
         >>> draw_line(screen, FONT, (0, 0, 255), (300, 50), (300, 250), arrow_type=ArrowType.NONE, label="No Arrow", label_offset_y=-10)
     """
 
-    # 1. Calculs des points et application des offsets
-    dx = end_pos[0] - start_pos[0]
-    dy = end_pos[1] - start_pos[1]
-    length = math.hypot(dx, dy)
-
-    if length == 0: 
+    # 0. Rejet rapide des arêtes entièrement hors de la zone de dessin, avant tout rendu
+    # de texte : l'étendue du label vient de sa surface si elle est connue (fournie ou en
+    # cache), sinon de FONT.size (métriques, sans rastérisation)
+    has_label = label_surface is not None or bool(label and FONT)
+    text_surface = label_surface
+    margin = thickness + arrow_size
+    if has_label:
+        if text_surface is not None:
+            margin += max(text_surface.get_size())
+        else:
+            text_surface, extent = _label_extent(FONT, label, label_color)
+            margin += extent
+        margin += abs(label_offset_x) + abs(label_offset_y)
+    if _is_outside_clip(surface.get_clip(), start_pos, end_pos, margin):
         return
 
-    # Vecteur unitaire (direction de la ligne)
-    unit_vx, unit_vy = dx / length, dy / length
-    
-    # Points où la POINTE de la flèche (ou la fin de la ligne) doit se trouver
-    # final_point_end est basé sur end_pos et offset_end
-    # final_point_start est basé sur start_pos et offset_start
-    final_point_end = (
-        end_pos[0] - unit_vx * offset_end,
-        end_pos[1] - unit_vy * offset_end
-    )
-    final_point_start = (
-        start_pos[0] + unit_vx * offset_start,
-        start_pos[1] + unit_vy * offset_start
-    )
-    
-    # 2. Détermination des points de fin de la TIGE de la ligne
-    
-    # Si une flèche est présente, la tige doit s'arrêter AVANT le final_point.
-    # On ajoute donc arrow_size*0.8 à l'offset (pour éviter que la ligne soit trop courte).
-    
-    offset_line_end = offset_end
-    if arrow_type == ArrowType.SINGLE or arrow_type == ArrowType.DOUBLE:
-        offset_line_end += arrow_size*0.8
-        
-    offset_line_start = offset_start
-    if arrow_type == ArrowType.DOUBLE:
-        offset_line_start += arrow_size*0.8
-
-    # Points d'extrémité de la tige
-    line_start = (
-        start_pos[0] + unit_vx * offset_line_start,
-        start_pos[1] + unit_vy * offset_line_start
-    )
-    line_end = (
-        end_pos[0] - unit_vx * offset_line_end,
-        end_pos[1] - unit_vy * offset_line_end
-    )
-    
-    # Vérification de la longueur après décalage
-    new_length = math.hypot(line_end[0] - line_start[0], line_end[1] - line_start[1])
-    if new_length < thickness: 
+    # 1. Calcul de la géométrie (tige et têtes de flèche)
+    edge_geometry = (_GEOM_DOUBLE if arrow_type is _ARROW_DOUBLE
+                     else _GEOM_SINGLE if arrow_type is _ARROW_SINGLE else _GEOM_NONE)
+    geometry = edge_geometry(start_pos, end_pos, thickness, arrow_size, offset_start, offset_end)
+    if geometry is None:
         return
+    line_start, line_end, arrow_heads = geometry
 
-    # 3. Dessin de la tige
+    # 2. Dessin de la tige
     pygame.draw.line(surface, color, line_start, line_end, thickness)
 
-    # 4. Fonction auxiliaire pour dessiner une tête de flèche
-    def draw_arrow_head(pos, angle_rad, size):
-        point1 = (
-            pos[0] - size * math.cos(angle_rad - math.pi / 6),
-            pos[1] - size * math.sin(angle_rad - math.pi / 6)
-        )
-        point2 = (
-            pos[0] - size * math.cos(angle_rad + math.pi / 6),
-            pos[1] - size * math.sin(angle_rad + math.pi / 6)
-        )
-        pygame.draw.polygon(surface, color, [pos, point1, point2])
-
-    # Angle de la ligne
-    angle = math.atan2(unit_vy, unit_vx)
+    # 3. Dessin des têtes de flèche
+    for points in arrow_heads:
+        pygame.draw.polygon(surface, color, points)
 
-    # 5. Dessin des têtes de flèche
-    if arrow_type == ArrowType.SINGLE or arrow_type == ArrowType.DOUBLE:
-        # Tête sur le point d'arrivée (final_point_end)
-        draw_arrow_head(final_point_end, angle, arrow_size)
+    # 4. Dessin du Nom
+    if has_label:
+        if text_surface is None:
+            text_surface = _get_label_surface(FONT, label, label_color)
+        # Le centre est calculé sur la tige de la ligne, arrondi tout de suite au pixel le
+        # plus proche : le label est toujours posé sur une position entière. floor(x + 0.5)
+        # arrondit toujours les .5 vers le haut (round() arrondit au pair et ferait sauter
+        # le label de 0 puis 2 pixels lors d'un déplacement pixel par pixel)
+        center_x = math.floor((line_start[0] + line_end[0]) / 2 + 0.5)
+        center_y = math.floor((line_start[1] + line_end[1]) / 2 + 0.5)
 
-    if arrow_type == ArrowType.DOUBLE:
-        # Tête sur le point de départ (final_point_start)
-        # Angle inversé (angle + pi)
-        draw_arrow_head(final_point_start, angle + math.pi, arrow_size)
-        
-    # 6. Dessin du Nom
-    if label and FONT:
-        try:
-            label = str(label)
-        except Exception:
-            label = "?"
-        # Le centre est calculé sur la tige de la ligne
-        center_x = (line_start[0] + line_end[0]) / 2
-        center_y = (line_start[1] + line_end[1]) / 2
-        
-        text_surface = FONT.render(label, True, label_color)
         text_rect = text_surface.get_rect()
-        text_rect.center = (int(center_x) + label_offset_x, int(center_y) + label_offset_y)
+        text_rect.center = (center_x + label_offset_x, center_y + label_offset_y)
         
         surface.blit(text_surface, text_rect)
 
-def draw_circle(surface: pygame.Surface, FONT: pygame.font.Font, color: tuple, center_color: tuple, position: tuple, radius: int, inner_radius: int=None, name: str=None) -> None:
+def queue_edge(color:tuple, start_pos:tuple, end_pos:tuple, thickness:int=6,
+               arrow_type:ArrowType=ArrowType.SINGLE, arrow_size:int=18,
+               offset_start:int=0, offset_end:int=0) -> None:
+    """
+    Met une arête en attente de dessin ; elle sera tracée au prochain flush_edges.
+
+    Les paramètres ont la même signification que pour draw_line. Les labels ne sont pas
+    gérés ici : les dessiner après flush_edges (par exemple avec draw_line sur une arête
+    ArrowType.NONE, ou directement via surface.blit).
+
+    Returns:
+        None
+    """
+    edge_geometry = (_GEOM_DOUBLE if arrow_type is _ARROW_DOUBLE
+                     else _GEOM_SINGLE if arrow_type is _ARROW_SINGLE else _GEOM_NONE)
+    geometry = edge_geometry(start_pos, end_pos, thickness, arrow_size, offset_start, offset_end)
+    if geometry is None:
+        return
+    line_start, line_end, arrow_heads = geometry
+    if not isinstance(color, (tuple, str)):
+        color = tuple(color)  # list ou pygame.Color : non hachables
+    _pending_lines.setdefault((color, thickness), []).append((line_start, line_end))
+    if arrow_heads:
+        _pending_polys.setdefault(color, []).extend(arrow_heads)
+
+def flush_edges(surface:pygame.Surface) -> None:
+    """
+    Dessine toutes les arêtes mises en attente par queue_edge, style par style, puis vide
+    la file d'attente.
+
+    Args:
+        surface (pygame.Surface): Surface sur laquelle dessiner.
+
+    Returns:
+        None
+
+    Notes:
+        - Les tiges sont tracées avant les têtes de flèche, comme dans draw_line.
+        - La surface est verrouillée (Surface.lock) pendant tout le lot plutôt qu'à
+          chaque primitive.
+        - pygame.draw.lines relierait les segments disjoints entre eux : chaque tige reste
+          donc un appel à pygame.draw.line, mais la couleur et l'épaisseur ne sont résolues
+          qu'une fois par groupe.
+    """
+    draw_line_ = pygame.draw.line
+    draw_polygon = pygame.draw.polygon
+    # Un seul verrouillage pour tout le lot au lieu d'un par primitive
+    surface.lock()
+    try:
+        for (color, thickness), segments in _pending_lines.items():
+            for line_start, line_end in segments:
+                draw_line_(surface, color, line_start, line_end, thickness)
+        for color, polygons in _pending_polys.items():
+            for points in polygons:
+                draw_polygon(surface, color, points)
+    finally:
+        surface.unlock()
+    _pending_lines.clear()
+    _pending_polys.clear()
+
+def draw_edges(surface:pygame.Surface, FONT:pygame.font.Font, color:tuple,
+               starts, ends, thickness:int=6,
+               arrow_type:ArrowType=ArrowType.SINGLE, arrow_size:int=18,
+               offset_start:int=0, offset_end:int=0,
+               labels=None, label_color:tuple=(0, 0, 0),
+               label_offset_x:int=0, label_offset_y:int=0) -> None:
+    """
+    Dessine un lot d'arêtes partageant le même style. Équivalent à un appel de draw_line
+    par arête, mais toute la géométrie (vecteurs unitaires, offsets, têtes de flèche) est
+    calculée en une fois avec numpy.
+
+    Args:
+        surface (pygame.Surface): Surface sur laquelle dessiner.
+        FONT (pygame.font.Font): Police utilisée pour les labels.
+        color (tuple): Couleur des lignes et des flèches (R, G, B).
+        starts (array-like): Tableau (N, 2) des points de départ.
+        ends (array-like): Tableau (N, 2) des points d'arrivée.
+        labels (Sequence[str], optional): N labels (ou None par arête). Défaut None.
+        Les autres paramètres sont identiques à ceux de draw_line.
+
+    Returns:
+        None
+
+    Raises:
+        ImportError: Si numpy n'est pas installé.
+
+    Notes:
+        - Les tiges et têtes de flèche sont tracées sous un seul Surface.lock ; les labels
+          sont blittés ensuite, et restent donc visibles par-dessus toutes les arêtes du lot.
+    """
+    if np is None:
+        raise ImportError("draw_edges nécessite numpy")
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+
+    d = ends - starts
+    length = np.hypot(d[:, 0], d[:, 1])
+    valid = length != 0
+    unit = np.zeros_like(d)
+    unit[valid] = d[valid] / length[valid, None]
+
+    offset_line_end = offset_end
+    if arrow_type is ArrowType.SINGLE or arrow_type is ArrowType.DOUBLE:
+        offset_line_end += arrow_size*0.8
+    offset_line_start = offset_start
+    if arrow_type is ArrowType.DOUBLE:
+        offset_line_start += arrow_size*0.8
+
+    line_start = starts + unit * offset_line_start
+    line_end = ends - unit * offset_line_end
+    stem = line_end - line_start
+    valid &= np.hypot(stem[:, 0], stem[:, 1]) >= thickness
+
+    # Arêtes dont la boîte englobante est hors de la zone de dessin : primitives ignorées
+    # (les labels sont testés plus bas avec une marge élargie de leur propre étendue)
+    clip = surface.get_clip()
+    margin = thickness + arrow_size
+    lo = np.minimum(starts, ends) - margin
+    hi = np.maximum(starts, ends) + margin
+    visible = valid & (hi[:, 0] >= clip.left) & (lo[:, 0] <= clip.right) \
+                    & (hi[:, 1] >= clip.top) & (lo[:, 1] <= clip.bottom)
+
+    # Têtes de flèche : triangles [pointe, point1, point2], direction de la ligne +/- 30°
+    heads = []
+    if arrow_type is ArrowType.SINGLE or arrow_type is ArrowType.DOUBLE:
+        heads.append((ends - unit * offset_end, unit))
+    if arrow_type is ArrowType.DOUBLE:
+        heads.append((starts + unit * offset_start, -unit))
+    head_points = []
+    for tips, u in heads:
+        ux, uy = u[:, 0], u[:, 1]
+        p1 = tips - arrow_size * np.column_stack((ux * _COS_30 + uy * _SIN_30, uy * _COS_30 - ux * _SIN_30))
+        p2 = tips - arrow_size * np.column_stack((ux * _COS_30 - uy * _SIN_30, uy * _COS_30 + ux * _SIN_30))
+        head_points.append((tips.tolist(), p1.tolist(), p2.tolist()))
+
+    line_start_l = line_start.tolist()
+    line_end_l = line_end.tolist()
+    draw_line_ = pygame.draw.line
+    draw_polygon = pygame.draw.polygon
+    # Primitives sous un seul verrouillage ; les labels (blits, interdits sur une surface
+    # verrouillée) sont dessinés ensuite, par-dessus toutes les arêtes.
+    surface.lock()
+    try:
+        for i in np.flatnonzero(visible).tolist():
+            draw_line_(surface, color, line_start_l[i], line_end_l[i], thickness)
+            for tips, p1, p2 in head_points:
+                draw_polygon(surface, color, [tips[i], p1[i], p2[i]])
+    finally:
+        surface.unlock()
+    if labels is None or not FONT:
+        return
+    starts_l = starts.tolist()
+    ends_l = ends.tolist()
+    label_margin = margin + abs(label_offset_x) + abs(label_offset_y)
+    for i in np.flatnonzero(valid).tolist():
+        label = labels[i]
+        if label:
+            # Rejet hors écran avant tout rendu, comme dans draw_line
+            text_surface, extent = _label_extent(FONT, label, label_color)
+            if _is_outside_clip(clip, starts_l[i], ends_l[i], label_margin + extent):
+                continue
+            if text_surface is None:
+                text_surface = _get_label_surface(FONT, label, label_color)
+            text_rect = text_surface.get_rect()
+            text_rect.center = (math.floor((line_start_l[i][0] + line_end_l[i][0]) / 2 + 0.5) + label_offset_x,
+                                math.floor((line_start_l[i][1] + line_end_l[i][1]) / 2 + 0.5) + label_offset_y)
+            surface.blit(text_surface, text_rect)
+
+def draw_circle(surface: pygame.Surface, FONT: pygame.font.Font, color: tuple, center_color: tuple, position: tuple, radius: int, inner_radius: int=None, name: str=None, label_surface: pygame.Surface=None) -> None:
     """
     Dessine un nœud circulaire composé d'un anneau extérieur et d'un cercle intérieur,
     puis affiche un label centré sur le nœud.
@@ -264,6 +633,7 @@ def draw_circle(surface: pygame.Surface, FONT: pygame.font.Font, color: tuple, c
         radius (int): Rayon du cercle extérieur en pixels.
         inner_radius (int, optional): Rayon du cercle intérieur en pixels. Si None, il est calculé comme radius * 0.8. Défaut None.
         name (str, optional): Texte à afficher centré dans le cercle. Si None, aucun texte n'est affiché. Si une erreur survient lors de la conversion en chaîne, "?" est utilisé. Défaut None.
+        label_surface (pygame.Surface, optional): Surface de label déjà rendue par l'appelant. Si fournie, elle est blittée directement à la place du rendu de name. Défaut None.
 
     Returns:
         None
@@ -271,7 +641,7 @@ def draw_circle(surface: pygame.Surface, FONT: pygame.font.Font, color: tuple, c
     Notes:
         - Le cercle intérieur est dessiné avec un rayon de radius * 0.8 pour créer un effet
           d'anneau/centre.
-        - Le label est rendu avec pygame.font.Font(None, 24) et centré sur la position fournie.
+        - Le label est rendu avec FONT (mis en cache comme pour draw_line) et centré sur la position fournie.
         - Les erreurs de conversion du nom en chaîne sont capturées et remplacées par "?". 
     
     Examples:
@@ -281,14 +651,33 @@ def draw_circle(surface: pygame.Surface, FONT: pygame.font.Font, color: tuple, c
     """
     if inner_radius is None:
         inner_radius = int(radius * 0.8)
-    if name is None:
-        name = ""
-    try:
-        name = str(name)
-    except Exception:
-        name = "?"
     pygame.draw.circle(surface, color, position, radius)
     pygame.draw.circle(surface, center_color, position, inner_radius)
-    text = FONT.render(name, True, (0, 0, 0))
+    text = label_surface
+    if text is None:
+        # Sans nom (ni surface fournie), rien à rendre ni à blitter
+        if name is None or name == "":
+            return
+        text = _get_label_surface(FONT, name, (0, 0, 0))
     text_rect = text.get_rect(center=position)
-    surface.blit(text, text_rect)
\ No newline at end of file
+    surface.blit(text, text_rect)
+
+if __name__ == "__main__":
+    # Vérification rapide, sans fenêtre : queue_edge / flush_edges doivent produire les
+    # mêmes pixels que draw_line, quel que soit le type de couleur accepté par pygame.
+    pygame.init()
+    edges = [((100, 100), (300, 200)), ((300, 50), (300, 250)), ((200, 20), (20, 280))]
+    for arrow_type in ArrowType:
+        for color in ((0, 204, 204), [0, 204, 204], pygame.Color(0, 204, 204)):
+            expected = pygame.Surface((400, 300))
+            expected.fill((255, 255, 255))
+            batched = expected.copy()
+            for start_pos, end_pos in edges:
+                draw_line(expected, None, color, start_pos, end_pos, arrow_type=arrow_type,
+                          offset_start=15, offset_end=15)
+                queue_edge(color, start_pos, end_pos, arrow_type=arrow_type,
+                           offset_start=15, offset_end=15)
+            flush_edges(batched)
+            assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(batched, "RGB"), \
+                (arrow_type, color)
+    print("queue_edge / flush_edges : OK")